@@ -0,0 +1,17 @@
+from wenqu.parsers import (
+    BaseParser,
+    MarkdownParser,
+    TXTParser,
+    get_parser_for_extension,
+    register_parser,
+)
+from wenqu.splitters import MarkdownTextSplitter
+
+__all__ = [
+    "BaseParser",
+    "MarkdownParser",
+    "MarkdownTextSplitter",
+    "TXTParser",
+    "get_parser_for_extension",
+    "register_parser",
+]
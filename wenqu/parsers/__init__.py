@@ -0,0 +1,15 @@
+from wenqu.parsers.base import (
+    BaseParser,
+    get_parser_for_extension,
+    register_parser,
+)
+from wenqu.parsers.markdown import MarkdownParser
+from wenqu.parsers.txt import TXTParser
+
+__all__ = [
+    "BaseParser",
+    "MarkdownParser",
+    "TXTParser",
+    "get_parser_for_extension",
+    "register_parser",
+]
@@ -0,0 +1,269 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+import urllib.request
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+# fasttext-predict installs its module under the top-level name "fasttext".
+import fasttext
+from langchain_core.documents import Document
+from loguru import logger
+
+PARSER_REGISTRY_EXTENSIONS: Dict[str, List[Type["BaseParser"]]] = defaultdict(list)
+
+ZH_SEPARATORS = ["\n\n", "\n", "。", "！", "？", "；", "，", " ", ""]
+
+_MODEL_URL = (
+    "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz"
+)
+_MODEL_PATH = os.path.join(
+    os.environ.get("FTLANG_CACHE", "/tmp/fasttext-langdetect"), "lid.176.ftz"
+)
+
+# Language detection is shared between all parser instances: texts queued by
+# concurrent get_chunks calls are predicted in one batch instead of one
+# model call per document.
+_DETECT_BATCH_INTERVAL = 0.005
+_DETECT_CACHE_MAXSIZE = 4096
+
+# Fallback when there is nothing to detect: fastText returns no label for a
+# wordless line, and an empty prefix never reaches the model at all.
+_DEFAULT_LANG = "EN"
+
+# FastText only needs newlines flattened out of the prefix; a translate
+# table does that in one C-level pass without the list/str churn of
+# " ".join(text.split()).
+_WS_TABLE = str.maketrans("\n\r\t", "   ")
+
+# LRU cache keyed by a hash of the 500-char prefix, so re-ingesting the same
+# content within a run never reaches FastText.
+_detect_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+# Queue and worker are bound to one event loop; they are recreated whenever
+# the running loop changes (e.g. successive asyncio.run calls) so a stale
+# queue from a closed loop is never reused.
+_detect_loop: Optional[asyncio.AbstractEventLoop] = None
+_detect_queue: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+_detect_task: Optional["asyncio.Task"] = None
+
+
+_detect_model = None
+
+
+def _get_detect_model():
+    # Lazily loaded so workers that never parse text pay no import cost.
+    # The handle is read-only after load and safe to share without a lock.
+    global _detect_model
+    if _detect_model is None:
+        if not os.path.exists(_MODEL_PATH):
+            os.makedirs(os.path.dirname(_MODEL_PATH), exist_ok=True)
+            urllib.request.urlretrieve(_MODEL_URL, _MODEL_PATH)
+        _detect_model = fasttext.load_model(_MODEL_PATH)
+    return _detect_model
+
+
+async def _detect_worker(
+    queue: "asyncio.Queue[Tuple[str, asyncio.Future]]",
+) -> None:
+    while True:
+        batch = [await queue.get()]
+        # Give concurrent callers a short window to pile onto the batch.
+        await asyncio.sleep(_DETECT_BATCH_INTERVAL)
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        # Fan out inside the try: a failure part-way through must resolve
+        # every future in the batch, never strand one.
+        try:
+            labels, _ = _get_detect_model().predict(
+                [text for text, _ in batch], k=1
+            )
+            for (_, future), label in zip(batch, labels):
+                if not future.done():
+                    future.set_result(
+                        label[0].replace("__label__", "").upper()
+                        if label
+                        else _DEFAULT_LANG
+                    )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+async def _detect_language_batched(text: str) -> str:
+    global _detect_loop, _detect_queue, _detect_task
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    if key in _detect_cache:
+        _detect_cache.move_to_end(key)
+        return _detect_cache[key]
+    loop = asyncio.get_running_loop()
+    if _detect_loop is not loop:
+        _detect_loop = loop
+        _detect_queue = asyncio.Queue()
+        _detect_task = None
+    if _detect_task is None or _detect_task.done():
+        _detect_task = loop.create_task(_detect_worker(_detect_queue))
+    future = loop.create_future()
+    await _detect_queue.put((text, future))
+    lang = await future
+    _detect_cache[key] = lang
+    if len(_detect_cache) > _DETECT_CACHE_MAXSIZE:
+        _detect_cache.popitem(last=False)
+    logger.info(f"detected language: {lang}")
+    return lang
+
+
+class BaseParser(ABC):
+
+    file_suffix: str = ""
+
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        separators: Optional[List[str]] = None,
+    ):
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separators = separators
+
+    @abstractmethod
+    async def get_chunks(
+        self,
+        filepath_or_content: Union[str, Path, bytes],
+        metadata: Optional[dict] = None,
+    ) -> List[Document]:
+        ...
+
+    async def get_language(self, text: str) -> str:
+        """Detect the language ("EN"/"ZH") of the first 500 chars of text."""
+        prefix = text[:500].translate(_WS_TABLE).strip()
+        if not prefix:
+            return _DEFAULT_LANG
+        return await _detect_language_batched(prefix)
+
+    @contextmanager
+    def input_as_str(
+        self, filepath_or_content: Union[str, Path, bytes]
+    ) -> Iterator[str]:
+        if isinstance(filepath_or_content, bytes):
+            yield filepath_or_content.decode("utf-8", errors="replace")
+        elif isinstance(filepath_or_content, Path):
+            with open(filepath_or_content, "r", encoding="utf-8") as fp:
+                yield fp.read()
+        elif isinstance(filepath_or_content, str):
+            yield filepath_or_content
+        else:
+            raise TypeError(
+                f"unsupported input type: {type(filepath_or_content)}"
+            )
+
+    @contextmanager
+    def input_as_path(
+        self, filepath_or_content: Union[str, Path, bytes]
+    ) -> Iterator[Path]:
+        if isinstance(filepath_or_content, bytes):
+            with tempfile.NamedTemporaryFile(suffix=self.file_suffix) as f:
+                f.write(filepath_or_content)
+                f.flush()
+                yield Path(f.name)
+        elif isinstance(filepath_or_content, str):
+            with tempfile.NamedTemporaryFile(
+                suffix=self.file_suffix, mode="w", encoding="utf-8"
+            ) as f:
+                f.write(filepath_or_content)
+                f.flush()
+                yield Path(f.name)
+        elif isinstance(filepath_or_content, Path):
+            yield filepath_or_content
+        else:
+            raise TypeError(
+                f"unsupported input type: {type(filepath_or_content)}"
+            )
+
+    @contextmanager
+    def input_as_bytes(
+        self, filepath_or_content: Union[str, Path, bytes]
+    ) -> Iterator[bytes]:
+        if isinstance(filepath_or_content, bytes):
+            yield filepath_or_content
+        elif isinstance(filepath_or_content, Path):
+            with open(filepath_or_content, "rb") as fp:
+                yield fp.read()
+        elif isinstance(filepath_or_content, str):
+            yield filepath_or_content.encode("utf-8")
+        else:
+            raise TypeError(
+                f"unsupported input type: {type(filepath_or_content)}"
+            )
+
+
+# Registration only happens at import time; lookups run once per document.
+# The defaultdict-of-lists is frozen into a flat first-parser map and parser
+# instances are cached per configuration, so the hot path is two dict hits.
+_EXT_TO_CLASS: Dict[str, Type["BaseParser"]] = {}
+_PARSER_CACHE: Dict[tuple, "BaseParser"] = {}
+
+
+def _freeze_value(value: Any) -> Any:
+    # Constructor arguments like separators=[...] must become hashable
+    # before they can key the parser cache.
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(
+            sorted((k, _freeze_value(v)) for k, v in value.items())
+        )
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _finalize_registry() -> None:
+    _EXT_TO_CLASS.clear()
+    for extension, parser_classes in PARSER_REGISTRY_EXTENSIONS.items():
+        if parser_classes:
+            _EXT_TO_CLASS[extension] = parser_classes[0]
+
+
+def register_parser(extensions: List[str]):
+    def decorator(parser_class: Type[BaseParser]) -> Type[BaseParser]:
+        for extension in extensions:
+            PARSER_REGISTRY_EXTENSIONS[extension].append(parser_class)
+        # Invalidate the frozen map; it is rebuilt on the next lookup.
+        _EXT_TO_CLASS.clear()
+        return parser_class
+
+    return decorator
+
+
+def get_parser_for_extension(
+    extension: str, *args: Any, **kwargs: Any
+) -> Optional[BaseParser]:
+    logger.debug(f"get parser for extension: {extension}")
+    if not _EXT_TO_CLASS and PARSER_REGISTRY_EXTENSIONS:
+        _finalize_registry()
+    parser_class = _EXT_TO_CLASS.get(extension)
+    if parser_class is None:
+        logger.warning(f"no parser registered for extension: {extension}")
+        return None
+    logger.debug(f"matched parser class: {parser_class}")
+    try:
+        key = (
+            extension,
+            _freeze_value(args),
+            frozenset((k, _freeze_value(v)) for k, v in kwargs.items()),
+        )
+        parser = _PARSER_CACHE.get(key)
+    except TypeError:
+        # Still unhashable; valid arguments must not be rejected, so hand
+        # back an uncached instance instead.
+        return parser_class(*args, **kwargs)
+    if parser is None:
+        parser = _PARSER_CACHE.setdefault(key, parser_class(*args, **kwargs))
+    return parser
@@ -0,0 +1,52 @@
+import asyncio
+from pathlib import Path
+from typing import List, Optional, Union
+
+from langchain_core.documents import Document
+
+from wenqu.parsers.base import ZH_SEPARATORS, BaseParser, register_parser
+from wenqu.splitters.markdown import MarkdownTextSplitter
+from wenqu.utils.markdown import remove_comments
+
+
+@register_parser([".md", ".markdown"])
+class MarkdownParser(BaseParser):
+
+    file_suffix = ".md"
+
+    async def get_markdown(
+        self, filepath_or_content: Union[str, Path, bytes]
+    ) -> str:
+        with self.input_as_str(filepath_or_content) as content:
+            # A full-text regex scan; keep it off the event loop for large
+            # documents.
+            return await asyncio.to_thread(remove_comments, content)
+
+    async def get_splitter(self, text: str) -> MarkdownTextSplitter:
+        # With explicit separators the ZH/EN configs are identical, so skip
+        # language detection entirely.
+        if self.separators is not None:
+            separators = self.separators
+        elif await self.get_language(text) == "ZH":
+            separators = ZH_SEPARATORS
+        else:
+            separators = None
+        return MarkdownTextSplitter(
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            separators=separators,
+        )
+
+    async def get_chunks(
+        self,
+        filepath_or_content: Union[str, Path, bytes],
+        metadata: Optional[dict] = None,
+    ) -> List[Document]:
+        md_content = await self.get_markdown(filepath_or_content)
+        splitter = await self.get_splitter(md_content)
+        # markdown-it parsing, rendering and the soup builds are all
+        # CPU-bound; run them on the default thread pool so concurrent
+        # document parses overlap instead of blocking the loop.
+        return await asyncio.to_thread(
+            splitter.create_documents, [md_content], [metadata or {}]
+        )
@@ -0,0 +1,41 @@
+import asyncio
+from pathlib import Path
+from typing import List, Optional, Union
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from wenqu.parsers.base import ZH_SEPARATORS, BaseParser, register_parser
+
+
+@register_parser([".txt"])
+class TXTParser(BaseParser):
+
+    file_suffix = ".txt"
+
+    async def get_splitter(self, text: str) -> RecursiveCharacterTextSplitter:
+        # With explicit separators the ZH/EN configs are identical, so skip
+        # language detection entirely.
+        if self.separators is not None:
+            separators = self.separators
+        elif await self.get_language(text) == "ZH":
+            separators = ZH_SEPARATORS
+        else:
+            separators = None
+        return RecursiveCharacterTextSplitter(
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            separators=separators,
+        )
+
+    async def get_chunks(
+        self,
+        filepath_or_content: Union[str, Path, bytes],
+        metadata: Optional[dict] = None,
+    ) -> List[Document]:
+        with self.input_as_str(filepath_or_content) as content:
+            splitter = await self.get_splitter(content)
+            # Character splitting is CPU-bound; keep it off the event loop.
+            return await asyncio.to_thread(
+                splitter.create_documents, [content], [metadata or {}]
+            )
@@ -0,0 +1,5 @@
+from wenqu.splitters.markdown import MarkdownTextSplitter
+
+__all__ = [
+    "MarkdownTextSplitter",
+]
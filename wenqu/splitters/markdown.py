@@ -0,0 +1,209 @@
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import mdformat_tables
+from bs4 import BeautifulSoup
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from loguru import logger
+from markdown_it import MarkdownIt
+from markdown_it.tree import SyntaxTreeNode
+from mdformat.renderer import MDRenderer
+
+_NONTEXT_TYPES = ("table", "image")
+_HTML_TYPES = ("html_block", "html_inline")
+
+# Parser and renderer are stateless for parse()/render(), so one instance of
+# each is shared per process instead of re-wiring the plugin chain for every
+# splitter (get_splitter builds a fresh splitter per document).
+_PARSER = MarkdownIt("gfm-like")
+_RENDERER = MDRenderer()
+
+
+class MarkdownTextSplitter(RecursiveCharacterTextSplitter):
+    """Split markdown by header sections, keeping tables and images as
+    standalone chunks."""
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.parser = _PARSER
+        self.renderer = _RENDERER
+        # Parsed soups keyed by node id; an HTML node is inspected by both
+        # the non-text check and the content extraction, and parsing it once
+        # covers all of them.
+        self._soup_cache: Dict[int, BeautifulSoup] = {}
+
+    def _split_text_iter(
+        self, text: str, metadata: Optional[dict] = None
+    ) -> Iterator[Document]:
+        # Yield Documents directly instead of (chunk, metadata) tuples that
+        # create_documents would immediately unpack and re-wrap.
+        self._soup_cache.clear()
+        tokens = self.parser.parse(text)
+        root = SyntaxTreeNode(tokens)
+        flags = self._compute_nontext_flags(root)
+        for title, nodes in self._split_by_header(root.children):
+            section_metadata = {"title": title}
+            section_text = self._get_treenodes_text(nodes, flags)
+            for chunk in super().split_text(section_text):
+                yield Document(
+                    page_content=chunk,
+                    metadata={**section_metadata, **(metadata or {})},
+                )
+            for content in self._get_nodes_nontext_contents(nodes, flags):
+                yield Document(
+                    page_content=content,
+                    metadata={**section_metadata, **(metadata or {})},
+                )
+
+    def create_documents(
+        self, texts: List[str], metadatas: Optional[List[dict]] = None
+    ) -> List[Document]:
+        _metadatas = metadatas or [{}] * len(texts)
+        documents = []
+        for i, text in enumerate(texts):
+            # Chunks come out in document order, so searching forward from a
+            # running cursor (clamped back by the overlap) keeps start-index
+            # lookup linear instead of rescanning the text per chunk.
+            cursor = 0
+            # Metadata holds flat primitives, so a shallow copy is enough
+            # and avoids deepcopy's memo-table walk per document.
+            for doc in self._split_text_iter(text, metadata=dict(_metadatas[i])):
+                if self._add_start_index:
+                    index = text.find(
+                        doc.page_content, max(0, cursor - self._chunk_overlap)
+                    )
+                    doc.metadata["start_index"] = index
+                    if index != -1:
+                        cursor = index + len(doc.page_content)
+                documents.append(doc)
+        return documents
+
+    def _split_by_header(
+        self, nodes: List[SyntaxTreeNode], parent_title: str = ""
+    ) -> Iterable[Tuple[str, List[SyntaxTreeNode]]]:
+        levels = [
+            int(node.tag[1]) for node in nodes if node.type == "heading"
+        ]
+        if not levels:
+            if nodes:
+                yield parent_title, nodes
+            return
+        split_level = min(levels)
+        header_text = ""
+        group: List[SyntaxTreeNode] = []
+        for node in nodes:
+            if node.type == "heading" and int(node.tag[1]) == split_level:
+                yield from self._split_by_header(
+                    group,
+                    parent_title=f"{parent_title} > {header_text}"
+                    if parent_title
+                    else header_text,
+                )
+                header_text = self._get_header_text(node)
+                group = []
+            else:
+                group.append(node)
+        yield from self._split_by_header(
+            group,
+            parent_title=f"{parent_title} > {header_text}"
+            if parent_title
+            else header_text,
+        )
+
+    def _get_header_text(self, node: SyntaxTreeNode) -> str:
+        return "".join(child.content for child in node.children).strip()
+
+    def _get_treenodes_text(
+        self, nodes: List[SyntaxTreeNode], flags: Dict[int, bool]
+    ) -> str:
+        text_nodes = [node for node in nodes if not flags[id(node)]]
+        tokens = list(
+            chain.from_iterable(node.to_tokens() for node in text_nodes)
+        )
+        if not tokens:
+            return ""
+        try:
+            return self.renderer.render(
+                tokens, {"parser_extension": [mdformat_tables]}, {}
+            )
+        except Exception as e:
+            # Render the whole section in one pass; fall back to per-node
+            # rendering only when the batch fails.
+            logger.warning(f"render markdown section failed: {e}")
+            return "\n\n".join(
+                self._get_treenode_text(node) for node in text_nodes
+            )
+
+    def _get_treenode_text(self, node: SyntaxTreeNode) -> str:
+        try:
+            return self.renderer.render(
+                node.to_tokens(), {"parser_extension": [mdformat_tables]}, {}
+            )
+        except Exception as e:
+            logger.warning(f"render markdown node failed: {e}")
+            return node.content
+
+    def _compute_nontext_flags(
+        self, root: SyntaxTreeNode
+    ) -> Dict[int, bool]:
+        """Build a has-non-text flag per node in one post-order pass, so
+        each node's content is inspected at most once."""
+        flags: Dict[int, bool] = {}
+
+        def visit(node: SyntaxTreeNode) -> bool:
+            flag = False
+            for child in node.children:
+                if visit(child):
+                    flag = True
+            flags[id(node)] = flag or self._is_nontext_node(node)
+            return flags[id(node)]
+
+        visit(root)
+        return flags
+
+    def _is_nontext_node(self, node: SyntaxTreeNode) -> bool:
+        if node.type in _NONTEXT_TYPES:
+            return True
+        if node.type in _HTML_TYPES:
+            return self._get_soup(node).find(["table", "img"]) is not None
+        return False
+
+    def _get_soup(self, node: SyntaxTreeNode) -> BeautifulSoup:
+        soup = self._soup_cache.get(id(node))
+        if soup is None:
+            soup = BeautifulSoup(node.content, "lxml")
+            self._soup_cache[id(node)] = soup
+        return soup
+
+    def _find_html_table(self, node: SyntaxTreeNode):
+        return self._get_soup(node).find("table")
+
+    def _find_html_img(self, node: SyntaxTreeNode):
+        return self._get_soup(node).find("img")
+
+    def _get_nodes_nontext_contents(
+        self, nodes: List[SyntaxTreeNode], flags: Dict[int, bool]
+    ) -> List[str]:
+        contents: List[str] = []
+        for node in nodes:
+            if flags[id(node)]:
+                contents.extend(self._get_nontext_content(node))
+        return contents
+
+    def _get_nontext_content(self, node: SyntaxTreeNode) -> List[str]:
+        contents: List[str] = []
+        if node.type == "table":
+            contents.append(self._get_treenode_text(node))
+        elif node.type == "image":
+            contents.append(node.attrs.get("src", ""))
+        elif node.type in _HTML_TYPES:
+            table = self._find_html_table(node)
+            if table is not None:
+                contents.append(str(table))
+            img = self._find_html_img(node)
+            if img is not None:
+                contents.append(str(img))
+        for child in node.children:
+            contents.extend(self._get_nontext_content(child))
+        return contents
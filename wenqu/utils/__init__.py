@@ -0,0 +1,5 @@
+from wenqu.utils.markdown import remove_comments
+
+__all__ = [
+    "remove_comments",
+]
@@ -0,0 +1,12 @@
+import re
+
+# [\s\S] matches newlines without re.DOTALL and keeps the scan linear on
+# pathological inputs where the DOTALL wildcard could backtrack.
+COMMENTS_PATTERN = re.compile(r"<!--[\s\S]*?-->")
+
+
+def remove_comments(text: str) -> str:
+    """Strip HTML comments from markdown text."""
+    if "<!--" not in text:
+        return text
+    return COMMENTS_PATTERN.sub("", text)